@@ -6,9 +6,9 @@ Features:
 - Query Wayback CDX API for snapshots of a given domain/path
 - Optional temporal filtering (user inputs dates in DD/MM/YYYY)
 - Option to collect all snapshots or a user-specified number
-- Progressive download with tqdm progress bar
-- SSL "soft" fallback: try normal verify, then retry with verify=False on SSL errors
-- Intermediate chunked saves every CHUNK_SIZE records (CSV, XLSX, JSON) with RAW content
+- Concurrent downloads (asyncio + aiohttp) with tqdm progress bar
+- Snapshot downloads skip TLS certificate verification (archived hosts often have broken certs)
+- Intermediate saves every CHUNK_SIZE records appended to a streaming CSV with RAW content
 - Final save that unifies and CLEANS all collected records into final CSV/XLSX/JSON
 - Timestamps in output files formatted as DD/MM/YYYY
 - Advanced cleaning:
@@ -23,29 +23,71 @@ Usage:
     python wayback_collector_advanced.py
 
 Requires:
-    pip install requests pandas beautifulsoup4 tqdm openpyxl trafilatura readability-lxml lxml
+    pip install requests aiohttp pandas beautifulsoup4 tqdm openpyxl xlsxwriter trafilatura readability-lxml lxml
 """
 
+import asyncio
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
+import csv
 import json
 import re
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from tqdm import tqdm
 from datetime import datetime
+from urllib.parse import urlsplit
 import pandas as pd
-import urllib3
 import trafilatura
 from readability import Document
-from collections import defaultdict
-
-# suppress insecure request warnings when verify=False used
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# orjson (Rust) encodes multi-MB content strings ~5-10x faster than stdlib json
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+# charset detection for snapshot bodies (ships with requests as a dependency)
+try:
+    from charset_normalizer import from_bytes as _cn_from_bytes
+except ImportError:
+    _cn_from_bytes = None
+
+# Shared session with connection pooling: all CDX queries hit web.archive.org,
+# so keep-alive reuses the same TCP/TLS sockets instead of re-handshaking per request.
+_RETRY = Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+_ADAPTER = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=_RETRY)
+
+_SESSION = requests.Session()
+_SESSION.mount('https://', _ADAPTER)
+_SESSION.mount('http://', _ADAPTER)
+_SESSION.headers['User-Agent'] = 'wayback-exporter/1.0'
+# advertise compression so Wayback sends gzipped HTML (4-6x smaller on the wire);
+# requests decompresses transparently. Only offer brotli when a decoder is
+# importable (mirrors requests' own default) — advertising br without one would
+# leave iter_lines chewing on raw compressed bytes
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        _ACCEPT_ENCODING = 'gzip, deflate, br'
+    except ImportError:
+        _ACCEPT_ENCODING = 'gzip, deflate'
+_SESSION.headers['Accept-Encoding'] = _ACCEPT_ENCODING
 
 # -------------------- Configuration --------------------
 OUTPUT_PREFIX = "wayback_export"
 CHUNK_SIZE = 500  # change if you want smaller/larger chunks
 CDX_BASE = "http://web.archive.org/cdx/search/cdx"
+FETCH_CONCURRENCY = 5  # simultaneous snapshot downloads (keep low — Wayback rate-limits)
 
 # Boilerplate detection thresholds
 BOILERPLATE_MIN_PAGES = 3        # minimal distinct pages a line must appear in to be candidate
@@ -57,26 +99,52 @@ MIN_WORDS_LINE = 3              # lines with fewer words than this are often nav
 
 # Regex for date-only lines (e.g., 26/07/04 or 2004-07-26)
 RE_DATE_LIKE = re.compile(r'^(?:\d{1,2}[\/\-\.\s]\d{1,2}[\/\-\.\s]\d{2,4}|\d{4}[\/\-\.\s]\d{1,2}[\/\-\.\s]\d{1,2})$')
-RE_EMAIL = re.compile(r'\b[\w\.-]+@[\w\.-]+\.\w+\b')
-RE_PHONE = re.compile(r'(\+?\d[\d\-\s\(\)]{5,}\d)')
-RE_COPYRIGHT = re.compile(r'©|copyright|Δήλωση|Προστασία|Τηλ:|Fax:|Fax|Τηλέφωνο', re.I)
+# Email + phone + copyright/contact unioned into one alternation so the hot
+# cleaning loop runs a single regex scan per line instead of three
+RE_JUNK = re.compile(
+    r'(?:©|copyright|Δήλωση|Προστασία|Τηλ:|Fax|Τηλέφωνο'
+    r'|\b[\w\.\-]+@[\w\.\-]+\.\w+\b'
+    r'|\+?\d[\d\-\s\(\)]{5,}\d)', re.I)
+RE_PUNCT = re.compile(r'[^\w\s]')
 NAV_WORDS = set(['Δείτε', 'αναλυτικά', 'αναλυτικα', 'Αρχική', 'Περισσότερα', 'Read', 'More', '»', '‹', '›', '...'])
 
+# Prefer the C-backed lxml parser for BeautifulSoup (~5-10x faster than html.parser)
+try:
+    import lxml.html as _lxml_html
+    BS4_PARSER = "lxml"
+except ImportError:
+    _lxml_html = None
+    BS4_PARSER = "html.parser"
+
+# Only build tree nodes for <title> and <body> — skips head metadata, link tags
+# and other boilerplate, so BS4 allocates far fewer Python objects per page
+_STRAINER = SoupStrainer(["title", "body"])
+
 # -------------------- Helper functions --------------------
 
+def _norm(s: str) -> str:
+    """Collapse runs of whitespace to single spaces (C-level, no regex engine)."""
+    return ' '.join(s.split())
+
+
+def _line_hash(s: str) -> int:
+    """64-bit key for the boilerplate tables — int keys probe faster and avoid
+    keeping a full copy of every line in the counting dict."""
+    return hash(s) & 0xFFFFFFFFFFFFFFFF
+
+
 def normalize_domain_input(domain_raw: str) -> str:
     """Normalize the user's domain/path input into a form usable in CDX queries."""
     if not domain_raw:
         return ""
     s = domain_raw.strip()
-    if s.startswith("http://"):
-        s = s[len("http://"):]
-    elif s.startswith("https://"):
-        s = s[len("https://"):]
-    return s.rstrip('/')
+    # urlsplit handles ports, query strings and scheme-less input uniformly,
+    # replacing the old startswith/slice branches
+    parts = urlsplit(s if "://" in s else "http://" + s)
+    return (parts.netloc + parts.path).rstrip('/')
 
 
-def build_cdx_query(domain_path: str, from_ts: str = None, to_ts: str = None):
+def build_cdx_query(domain_path: str, from_ts: str = None, to_ts: str = None, limit: int = None):
     params = {
         'url': f"{domain_path}/*",
         'output': 'json',
@@ -84,10 +152,15 @@ def build_cdx_query(domain_path: str, from_ts: str = None, to_ts: str = None):
         'filter': 'statuscode:200'
     }
     query_parts = [f"url={params['url']}", f"output={params['output']}", f"fl={params['fl']}", f"filter={params['filter']}"]
+    # drop duplicate captures server-side instead of downloading them
+    query_parts.append("collapse=digest")
     if from_ts:
         query_parts.append(f"from={from_ts}")
     if to_ts:
         query_parts.append(f"to={to_ts}")
+    if limit:
+        # cap server-side so the CDX response only contains what we'll keep
+        query_parts.append(f"limit={limit}")
     query = CDX_BASE + "?" + "&".join(query_parts)
     return query
 
@@ -97,11 +170,11 @@ def parse_date_input_ddmmyyyy(inp: str) -> datetime:
 
 
 def ts_to_readable_date(ts: str) -> str:
-    try:
-        dt = datetime.strptime(ts[:14], "%Y%m%d%H%M%S")
-        return dt.strftime("%d/%m/%Y")
-    except Exception:
-        return ts
+    # CDX timestamps are fixed-format YYYYMMDDhhmmss — slicing beats strptime ~20x
+    s = ts[:8]
+    if len(s) == 8 and s.isdigit():
+        return f"{s[6:8]}/{s[4:6]}/{s[0:4]}"
+    return ts
 
 
 def extract_with_trafilatura(url_or_html: str, is_html=False):
@@ -110,14 +183,20 @@ def extract_with_trafilatura(url_or_html: str, is_html=False):
     try:
         if is_html:
             downloaded = url_or_html
-            res = trafilatura.extract(downloaded, include_comments=False, include_tables=False, include_formatting=False)
-            meta = trafilatura.extract_metadata(downloaded)
         else:
             downloaded = trafilatura.fetch_url(url_or_html)
             if not downloaded:
                 return "", ""
-            res = trafilatura.extract(downloaded, include_comments=False, include_tables=False, include_formatting=False)
-            meta = trafilatura.extract_metadata(downloaded)
+        # parse once with lxml and hand the same tree to both trafilatura calls —
+        # extract() and extract_metadata() each re-parsed the HTML string before
+        if _lxml_html is not None:
+            try:
+                downloaded = _lxml_html.fromstring(downloaded)
+            except Exception:
+                pass  # let trafilatura parse the string itself
+        # metadata first: extract() may prune the tree in place
+        meta = trafilatura.extract_metadata(downloaded)
+        res = trafilatura.extract(downloaded, include_comments=False, include_tables=False, include_formatting=False)
         title = ""
         if meta and hasattr(meta, 'get'):
             title = meta.get('title', '') if meta else ''
@@ -133,7 +212,7 @@ def extract_with_readability(html: str):
         doc = Document(html)
         title = doc.short_title() or ""
         summary = doc.summary()
-        soup = BeautifulSoup(summary, "html.parser")
+        soup = BeautifulSoup(summary, BS4_PARSER)
         text = soup.get_text(separator="\n")
         lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
         return title, "\n".join(lines)
@@ -143,10 +222,11 @@ def extract_with_readability(html: str):
 
 def extract_with_bs4(html: str):
     try:
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, BS4_PARSER, parse_only=_STRAINER)
         title = ""
         if soup.title and soup.title.string:
             title = soup.title.string.strip()
+        # scripts/styles inside <body> still get parsed, so drop them here
         for t in soup(["script", "style", "noscript"]):
             t.decompose()
         text = soup.get_text(separator="\n")
@@ -156,15 +236,154 @@ def extract_with_bs4(html: str):
         return "", ""
 
 
-def safe_request_get(url: str, timeout: int = 15) -> str:
+def _extract_pipeline(html: str):
+    """Run the trafilatura -> readability -> bs4 extraction cascade on one page.
+    Returns (title, main_text); main_text is "" when nothing could be extracted."""
+    title, main_text = "", ""
+    try:
+        title, main_text = extract_with_trafilatura(html, is_html=True)
+    except Exception:
+        title, main_text = "", ""
+
+    if not main_text.strip():
+        try:
+            title2, main_text2 = extract_with_readability(html)
+            if main_text2 and len(main_text2) > len(main_text):
+                title = title2 or title
+                main_text = main_text2
+        except Exception:
+            pass
+
+    if not main_text.strip():
+        try:
+            title3, main_text3 = extract_with_bs4(html)
+            if main_text3:
+                title = title3 or title
+                main_text = main_text3
+        except Exception:
+            pass
+
+    return title, main_text
+
+
+def _charset_fallback(resp, body):
+    """Pick a charset for responses whose Content-Type names none.
+
+    aiohttp defaults to strict UTF-8 in that case, but legacy Greek pages are
+    typically windows-1253/ISO-8859-7 and would raise UnicodeDecodeError; detect
+    the encoding like the old requests path did via apparent_encoding."""
+    if _cn_from_bytes is not None:
+        best = _cn_from_bytes(body).best()
+        if best is not None and best.encoding:
+            return best.encoding
+    return 'utf-8'
+
+
+async def _fetch_one(sem, session, item, queue, loop, executor):
+    """Download one snapshot, extract its text off the event loop, queue the record."""
     try:
-        resp = requests.get(url, timeout=timeout)
-        resp.raise_for_status()
-        return resp.text
-    except requests.exceptions.SSLError:
-        resp = requests.get(url, timeout=timeout, verify=False)
-        resp.raise_for_status()
-        return resp.text
+        timestamp, original = item
+    except Exception:
+        tqdm.write("⚠️ Παράλειψη μη αναμενόμενου αρχείου CDX entry")
+        return
+
+    archive_url = f"https://web.archive.org/web/{timestamp}/{original}"
+
+    async with sem:
+        try:
+            async with session.get(archive_url, timeout=aiohttp.ClientTimeout(total=15)) as r:
+                r.raise_for_status()
+                html = await r.text()
+        except Exception as e:
+            tqdm.write(f"⚠️ Παράλειψη (λ.λ. αίτημα) {archive_url} ({e})")
+            return
+
+    # extraction is CPU work (BS4/trafilatura) — run it in a worker process so
+    # pages extract in parallel instead of serially behind the GIL
+    title, main_text = await loop.run_in_executor(executor, _extract_pipeline, html)
+
+    if not main_text.strip():
+        tqdm.write(f"⚠️ Παράλειψη (κενό περιεχόμενο) {archive_url}")
+        return
+
+    # tuple payload appended column-wise by the chunk writer; readable timestamp
+    # formatted once here and reused by every save
+    await queue.put((timestamp, ts_to_readable_date(timestamp), original,
+                     archive_url, title or "", main_text))
+
+
+async def _chunk_writer(queue, columns):
+    """Consume completed records into the column store and save raw chunks every
+    CHUNK_SIZE. Saves run on a single-worker thread pool so chunk I/O overlaps
+    the ongoing downloads instead of pausing them. Flushes the partial chunk on
+    exit so interrupted runs still keep their data."""
+    chunk_start = 0
+    chunk_index = 1
+    writer_pool = ThreadPoolExecutor(max_workers=1)
+    pending_saves = []
+    try:
+        while True:
+            rec = await queue.get()
+            if rec is None:
+                break
+            timestamp, ts_readable, original, archive_url, title, raw_content = rec
+            columns['timestamp'].append(timestamp)
+            columns['timestamp_readable'].append(ts_readable)
+            columns['original_url'].append(original)
+            columns['archive_url'].append(archive_url)
+            columns['title'].append(title)
+            columns['raw_content'].append(raw_content)
+            columns['content'].append("")   # placeholder for cleaned
+            n = len(columns['timestamp'])
+            if n - chunk_start >= CHUNK_SIZE:
+                # hand sliced copies to the writer thread and keep consuming
+                chunk = {k: v[chunk_start:n] for k, v in columns.items()}
+                pending_saves.append(writer_pool.submit(save_chunk_raw, chunk, chunk_index))
+                chunk_index += 1
+                chunk_start = n
+    finally:
+        n = len(columns['timestamp'])
+        if n > chunk_start:
+            chunk = {k: v[chunk_start:n] for k, v in columns.items()}
+            pending_saves.append(writer_pool.submit(save_chunk_raw, chunk, chunk_index))
+        # make sure all pending chunk writes hit disk before the final save,
+        # then re-raise the first save failure — a dropped chunk (disk full,
+        # permissions) must not pass silently
+        writer_pool.shutdown(wait=True)
+        for fut in pending_saves:
+            exc = fut.exception()
+            if exc is not None:
+                raise exc
+
+
+async def _download_snapshots(rows, columns):
+    """Fetch all snapshots concurrently (bounded by FETCH_CONCURRENCY) and
+    stream completed records through a queue into the chunk writer."""
+    sem = asyncio.Semaphore(FETCH_CONCURRENCY)
+    queue = asyncio.Queue()
+    loop = asyncio.get_running_loop()
+    connector = aiohttp.TCPConnector(limit=20, ssl=False)
+    headers = {'User-Agent': _SESSION.headers['User-Agent']}
+    executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+
+    async with aiohttp.ClientSession(connector=connector, headers=headers,
+                                     fallback_charset_resolver=_charset_fallback) as session:
+        writer = asyncio.create_task(_chunk_writer(queue, columns))
+        try:
+            with tqdm(total=len(rows), desc='Λήψη snapshot σελίδων', unit='snap') as pbar:
+                async def tracked(item):
+                    await _fetch_one(sem, session, item, queue, loop, executor)
+                    pbar.update(1)
+                await asyncio.gather(*(tracked(it) for it in rows))
+        finally:
+            queue.put_nowait(None)
+            try:
+                await writer
+            except asyncio.CancelledError:
+                pass
+            # every extraction future is already awaited by now, so waiting is
+            # free — and wait=False can trip EBADF noise in the atexit hook
+            executor.shutdown(wait=True)
 
 
 def looks_like_date_line(line: str) -> bool:
@@ -175,74 +394,112 @@ def is_junk_line(line: str) -> bool:
     s = line.strip()
     if not s:
         return True
-    # email or phone
-    if RE_EMAIL.search(s) or RE_PHONE.search(s):
-        return True
-    # copyright/contact
-    if RE_COPYRIGHT.search(s):
+    # navigation words / arrows / short UI strings
+    if s in NAV_WORDS or s in ('»', '«', '›', '‹', '...'):
         return True
-    # navigation words alone
-    if s in NAV_WORDS:
+    # very short or very few words — cheapest checks, done before any regex
+    if len(s) < MIN_LINE_LENGTH or len(s.split()) < MIN_WORDS_LINE:
         return True
-    # arrows or short UI strings
-    if s in ('»', '«', '›', '‹', '...'):
+    # email / phone / copyright / contact in a single scan
+    if RE_JUNK.search(s):
         return True
     # date-like lines
     if looks_like_date_line(s):
         return True
-    # very short or very few words
-    if len(s) < MIN_LINE_LENGTH or len(s.split()) < MIN_WORDS_LINE:
-        return True
     return False
 
 
-def save_chunk_raw(records, chunk_index: int):
-    """Save chunk with RAW content (before boilerplate removal)."""
-    if not records:
+def _write_json(rows, json_name: str):
+    """Serialize rows with orjson when available, stdlib json otherwise."""
+    if orjson is not None:
+        with open(json_name, 'wb') as jf:
+            jf.write(orjson.dumps(rows, option=orjson.OPT_INDENT_2))
+    else:
+        with open(json_name, 'w', encoding='utf-8') as jf:
+            json.dump(rows, jf, ensure_ascii=False, indent=2)
+
+
+def _write_xlsx(df, xlsx_name: str):
+    """Write XLSX via xlsxwriter in constant_memory mode so rows stream to disk
+    instead of the whole workbook sitting in RAM; fall back to the default engine.
+
+    Rows are written in row order ourselves: to_excel emits cells column-major,
+    and constant_memory mode silently drops writes to already-flushed rows."""
+    try:
+        import xlsxwriter
+    except ImportError:
+        df.to_excel(xlsx_name, index=False)
+        return
+    with xlsxwriter.Workbook(xlsx_name, {'constant_memory': True}) as book:
+        sheet = book.add_worksheet()
+        sheet.write_row(0, 0, df.columns)
+        for i, row in enumerate(df.itertuples(index=False), start=1):
+            sheet.write_row(i, 0, row)
+
+
+# Streaming CSV for the raw chunk saves — opened lazily on first chunk
+_STREAM_FIELDS = ['timestamp', 'original_url', 'archive_url', 'title', 'raw_content']
+_stream_file = None
+_stream_writer = None
+
+
+def save_chunk_raw(chunk_cols, chunk_index: int):
+    """Append a chunk of RAW columns (before boilerplate removal) to the streaming CSV.
+
+    Writing XLSX/JSON per chunk just serialized everything twice — the unified
+    formats are produced once at the final save; chunks only append CSV rows.
+    chunk_cols is a dict of sliced column lists from the record store."""
+    global _stream_file, _stream_writer
+    count = len(chunk_cols.get('timestamp', ()))
+    if not count:
         return
-    base = f"{OUTPUT_PREFIX}_chunk_raw_{chunk_index}"
-    rows = []
-    for r in records:
-        rows.append({
-            'timestamp': ts_to_readable_date(r.get('timestamp', '')),
-            'original_url': r.get('original_url', ''),
-            'archive_url': r.get('archive_url', ''),
-            'title': r.get('title', ''),
-            'raw_content': r.get('raw_content', '')
-        })
-    df = pd.DataFrame(rows)
-    csv_name = base + '.csv'
-    xlsx_name = base + '.xlsx'
-    json_name = base + '.json'
-    df.to_csv(csv_name, index=False, encoding='utf-8')
-    df.to_excel(xlsx_name, index=False)
-    with open(json_name, 'w', encoding='utf-8') as jf:
-        json.dump(rows, jf, ensure_ascii=False, indent=2)
-    print(f"\n💾 Ενδιάμεση raw αποθήκευση chunk #{chunk_index}: {csv_name}, {xlsx_name}, {json_name}")
-
-
-def save_final_clean(records):
+    csv_name = f"{OUTPUT_PREFIX}_stream.csv"
+    if _stream_writer is None:
+        _stream_file = open(csv_name, 'a', newline='', encoding='utf-8')
+        _stream_writer = csv.writer(_stream_file)
+        if _stream_file.tell() == 0:
+            _stream_writer.writerow(_STREAM_FIELDS)
+    _stream_writer.writerows(zip(
+        chunk_cols['timestamp_readable'],
+        chunk_cols['original_url'],
+        chunk_cols['archive_url'],
+        chunk_cols['title'],
+        chunk_cols['raw_content']))
+    _stream_file.flush()
+    print(f"\n💾 Ενδιάμεση raw αποθήκευση chunk #{chunk_index}: {csv_name} (+{count} εγγραφές)")
+
+
+def save_final_clean(columns):
     """After cleaning, save final CSV/XLSX/JSON with cleaned 'content' field and readable timestamps."""
-    if not records:
+    if not columns['timestamp']:
         print("⚠️ Δεν υπάρχουν δεδομένα για τελική αποθήκευση.")
         return
-    rows = []
-    for r in records:
-        rows.append({
-            'timestamp': ts_to_readable_date(r.get('timestamp', '')),
-            'original_url': r.get('original_url', ''),
-            'archive_url': r.get('archive_url', ''),
-            'title': r.get('title', ''),
-            'content': r.get('content', '')
-        })
-    df = pd.DataFrame(rows)
     csv_name = OUTPUT_PREFIX + '_all_clean.csv'
     xlsx_name = OUTPUT_PREFIX + '_all_clean.xlsx'
     json_name = OUTPUT_PREFIX + '_all_clean.json'
-    df.to_csv(csv_name, index=False, encoding='utf-8')
-    df.to_excel(xlsx_name, index=False)
-    with open(json_name, 'w', encoding='utf-8') as jf:
-        json.dump(rows, jf, ensure_ascii=False, indent=2)
+    fields = ['timestamp', 'original_url', 'archive_url', 'title', 'content']
+    # CSV straight through csv.writer — pandas routes every cell through a Python
+    # formatter, which is slow on long text columns
+    with open(csv_name, 'w', newline='', encoding='utf-8') as f:
+        w = csv.writer(f)
+        w.writerow(fields)
+        w.writerows(zip(
+            columns['timestamp_readable'],
+            columns['original_url'],
+            columns['archive_url'],
+            columns['title'],
+            columns['content']))
+    # XLSX and JSON keep the DataFrame path — the column lists ingest directly,
+    # no per-row dict intermediates
+    df = pd.DataFrame({
+        'timestamp': columns['timestamp_readable'],
+        'original_url': columns['original_url'],
+        'archive_url': columns['archive_url'],
+        'title': columns['title'],
+        'content': columns['content'],
+    })
+    _write_xlsx(df, xlsx_name)
+    _write_json(df.to_dict(orient='records'), json_name)
     print(f"\n💾 Τελική καθαρή αποθήκευση: {csv_name}, {xlsx_name}, {json_name}")
 
 
@@ -303,158 +560,116 @@ def main():
                 pass
             print("⚠️ Γράψε έναν θετικό ακέραιο αριθμό.")
 
-    cdx_url = build_cdx_query(domain_path, from_ts=from_ts, to_ts=to_ts)
+    cdx_url = build_cdx_query(domain_path, from_ts=from_ts, to_ts=to_ts, limit=max_snapshots)
     print(f"\n🔍 Ερώτημα στο Wayback CDX API...\n   {cdx_url}\n")
 
     try:
-        resp = requests.get(cdx_url, timeout=20)
-        resp.raise_for_status()
-        raw = resp.json()
+        rows = []
+        with _SESSION.get(cdx_url, timeout=20, stream=True) as resp:
+            resp.raise_for_status()
+            # the CDX json output puts one record per line, so iterating lines keeps
+            # memory flat instead of materializing the full response + parsed array
+            header_seen = False
+            for line in resp.iter_lines(decode_unicode=True):
+                if not line:
+                    continue
+                line = line.strip()
+                if line in ('[', ']'):
+                    continue
+                if line.startswith('[['):
+                    line = line[1:]
+                line = line.rstrip(',')
+                if line.endswith(']]'):
+                    line = line[:-1]
+                if not header_seen:
+                    # first record is the fl header row ["timestamp","original"]
+                    header_seen = True
+                    continue
+                rows.append(_json_loads(line))
     except Exception as e:
         print(f"❌ Σφάλμα στο αίτημα CDX API: {e}")
         return
 
-    if len(raw) <= 1:
+    if not rows:
         print("⚠️ Το CDX API δεν επέστρεψε snapshots για τα κριτήρια αυτά.")
         return
 
-    rows = raw[1:]
-    if max_snapshots is not None:
-        rows = rows[:max_snapshots]
-
     total = len(rows)
     print(f"✅ Βρέθηκαν {total} snapshots (θα επιχειρηθούν λήψεις).\n")
 
-    all_records = []      # list of dicts with timestamp, original_url, archive_url, title, raw_content, content (cleaned later)
-    chunk_buffer = []
-    chunk_index = 1
+    # struct-of-arrays record store: parallel column lists instead of one dict per
+    # record — one list slot per row instead of a 5-key dict, and the columns feed
+    # Pandas/csv.writer directly without per-row intermediates
+    columns = {
+        'timestamp': [],
+        'timestamp_readable': [],
+        'original_url': [],
+        'archive_url': [],
+        'title': [],
+        'raw_content': [],
+        'content': []      # filled by the cleaning pass
+    }
 
     try:
-        for item in tqdm(rows, desc='Λήψη snapshot σελίδων', unit='snap'):
-            try:
-                timestamp, original = item
-            except Exception:
-                tqdm.write("⚠️ Παράλειψη μη αναμενόμενου αρχείου CDX entry")
-                continue
-
-            archive_url = f"https://web.archive.org/web/{timestamp}/{original}"
-
-            try:
-                html = safe_request_get(archive_url, timeout=15)
-            except Exception as e:
-                tqdm.write(f"⚠️ Παράλειψη (λ.λ. αίτημα) {archive_url} ({e})")
-                continue
-
-            # Attempt extraction: trafilatura -> readability -> bs4 fallback
-            title, main_text = "", ""
-            try:
-                # try trafilatura on HTML string
-                title, main_text = extract_with_trafilatura(html, is_html=True)
-            except Exception:
-                title, main_text = "", ""
-
-            if not main_text.strip():
-                # try readability
-                try:
-                    title2, main_text2 = extract_with_readability(html)
-                    if main_text2 and len(main_text2) > len(main_text):
-                        title = title2 or title
-                        main_text = main_text2
-                except Exception:
-                    pass
-
-            if not main_text.strip():
-                # bs4 fallback
-                try:
-                    title3, main_text3 = extract_with_bs4(html)
-                    if main_text3:
-                        title = title3 or title
-                        main_text = main_text3
-                except Exception:
-                    pass
-
-            if not main_text.strip():
-                tqdm.write(f"⚠️ Παράλειψη (κενό περιεχόμενο) {archive_url}")
-                continue
-
-            # store raw content (pre-clean)
-            rec = {
-                'timestamp': timestamp,
-                'original_url': original,
-                'archive_url': archive_url,
-                'title': title or "",
-                'raw_content': main_text,
-                'content': ""   # placeholder for cleaned
-            }
-            all_records.append(rec)
-            chunk_buffer.append(rec)
-
-            # chunk raw save
-            if len(chunk_buffer) >= CHUNK_SIZE:
-                save_chunk_raw(chunk_buffer, chunk_index)
-                chunk_index += 1
-                chunk_buffer = []
-
+        asyncio.run(_download_snapshots(rows, columns))
     except KeyboardInterrupt:
         print("\n⏹️ Εκτέλεση διακόπηκε από τον χρήστη. Θα γίνει αποθήκευση των δεδομένων που έχουν συλλεχθεί...")
 
-    finally:
-        # save remaining raw chunk
-        if chunk_buffer:
-            save_chunk_raw(chunk_buffer, chunk_index)
-
     # If no records collected
-    if not all_records:
+    if not columns['timestamp']:
         print("⚠️ Δεν συλλέχθηκαν εγγραφές. Τέλος.")
         return
 
     # -------------------- Advanced post-processing / boilerplate detection --------------------
     print("\n🔎 Εκτέλεση προηγμένης ανίχνευσης boilerplate και καθαρισμού...")
 
-    # Build index: line -> set(page_indices)
-    line_pages = defaultdict(set)
-    page_lines = []  # list of lists (per page)
-    for idx, rec in enumerate(all_records):
-        lines = [ln.strip() for ln in rec['raw_content'].splitlines() if ln.strip()]
-        page_lines.append(lines)
-        unique_lines = set(lines)
-        for ln in unique_lines:
-            if len(ln) < 3:
+    # Count on how many pages each normalized line appears — only the count is ever
+    # read, so a Counter over per-page unique sets replaces the sets of page indices.
+    # Keys are 64-bit line hashes; repr_line keeps one string per hash for the
+    # punctuation-expansion step below.
+    raws = columns['raw_content']
+    cleaned = columns['content']
+
+    line_counts = Counter()
+    repr_line = {}
+    for raw in raws:
+        unique_hashes = set()
+        for ln in raw.splitlines():
+            if len(ln.strip()) < 3:
                 continue
-            # normalize some whitespace and punctuation for detection
-            nl = re.sub(r'\s+', ' ', ln).strip()
-            line_pages[nl].add(idx)
-
-    num_pages = len(all_records)
-    # detect boilerplate candidates
-    boilerplate_lines = set()
-    for ln, pageset in line_pages.items():
-        count = len(pageset)
-        if count >= BOILERPLATE_MIN_PAGES or (count / num_pages) >= BOILERPLATE_RATIO:
-            # also filter out lines that are short but repeat often (menus)
-            boilerplate_lines.add(ln)
-
-    # Expand boilerplate patterns by heuristics: small variations (lower/strip punctuation)
-    expanded_boilerplate = set(boilerplate_lines)
-    for ln in list(boilerplate_lines):
-        lnl = ln.lower()
-        # also consider stripped punctuation version
-        s = re.sub(r'[^\w\s]', '', lnl).strip()
-        if s and s != lnl:
-            expanded_boilerplate.add(s)
+            nl = _norm(ln).lower()
+            h = _line_hash(nl)
+            unique_hashes.add(h)
+            repr_line.setdefault(h, nl)
+        line_counts.update(unique_hashes)
+
+    num_pages = len(raws)
+    # detect boilerplate candidates (also catches short lines repeating often — menus)
+    boilerplate_hashes = {
+        h for h, count in line_counts.items()
+        if count >= BOILERPLATE_MIN_PAGES or (count / num_pages) >= BOILERPLATE_RATIO
+    }
+
+    # Expand boilerplate patterns by heuristics: stripped-punctuation variants
+    expanded_hashes = set(boilerplate_hashes)
+    for h in list(boilerplate_hashes):
+        ln = repr_line[h]
+        s = RE_PUNCT.sub('', ln).strip()
+        if s and s != ln:
+            expanded_hashes.add(_line_hash(s))
 
     # Now clean each page: remove boilerplate lines and junk lines
     cleaned_count = 0
-    for idx, rec in enumerate(all_records):
-        raw = rec['raw_content']
+    for idx, raw in enumerate(raws):
         lines = [ln.strip() for ln in raw.splitlines() if ln.strip()]
         cleaned_lines = []
         for ln in lines:
-            norm = re.sub(r'\s+', ' ', ln).strip()
+            norm = _norm(ln)
             norm_low = norm.lower()
-            short_norm = re.sub(r'[^\w\s]', '', norm_low).strip()
-            # skip if matches boilerplate (exact or normalized)
-            if norm in boilerplate_lines or norm_low in boilerplate_lines or short_norm in expanded_boilerplate:
+            short_norm = RE_PUNCT.sub('', norm_low).strip()
+            # skip if matches boilerplate (lowercased exact or punctuation-stripped);
+            # hashed membership test — O(1) int compare instead of string equality
+            if _line_hash(norm_low) in boilerplate_hashes or _line_hash(short_norm) in expanded_hashes:
                 continue
             # skip if junk heuristics
             if is_junk_line(norm):
@@ -468,15 +683,15 @@ def main():
             # try lighter cleaning: remove pure junk lines only
             lite = [ln for ln in lines if not is_junk_line(ln)]
             final_text = "\n".join(lite).strip()
-        rec['content'] = final_text
+        cleaned[idx] = final_text
         if final_text:
             cleaned_count += 1
 
     print(f"✅ Καθαρίστηκαν κείμενα για {cleaned_count}/{num_pages} σελίδες.")
 
     # -------------------- Save final cleaned outputs --------------------
-    save_final_clean(all_records)
-    print(f"\nΟλοκληρώθηκε — συνολικά σελίδες που σώθηκαν: {len(all_records)}")
+    save_final_clean(columns)
+    print(f"\nΟλοκληρώθηκε — συνολικά σελίδες που σώθηκαν: {num_pages}")
 
 
 if __name__ == '__main__':